@@ -1,7 +1,14 @@
 """
 API router configuration
+
+Endpoint handlers are async, so database and outbound HTTP calls made from
+them must be awaited (AsyncSession, async clients) rather than blocking.
 """
+from typing import List, Optional
+
 from fastapi import APIRouter
+from fastapi.routing import APIRoute
+from starlette.routing import Route
 
 from app.api.auth import router as auth_router
 from app.api.users import router as users_router
@@ -9,11 +16,61 @@ from app.api.conversations import router as conversations_router
 from app.api.nvc import router as nvc_router
 from app.api.research import router as research_router
 
+
+def mount_flat(
+    target: APIRouter, sub: APIRouter, prefix: str = "", tags: Optional[List[str]] = None
+) -> None:
+    """Copy the routes of ``sub`` onto ``target`` under ``prefix``.
+
+    Unlike ``include_router`` this leaves no nested router behind, so a request
+    is matched against one flat route list instead of walking a router tree.
+    """
+    for route in sub.routes:
+        if isinstance(route, APIRoute):
+            target.add_api_route(
+                prefix + route.path,
+                route.endpoint,
+                response_model=route.response_model,
+                status_code=route.status_code,
+                tags=[*(tags or []), *route.tags],
+                dependencies=route.dependencies,
+                summary=route.summary,
+                description=route.description,
+                response_description=route.response_description,
+                responses=route.responses,
+                deprecated=route.deprecated,
+                methods=route.methods,
+                operation_id=route.operation_id,
+                response_model_include=route.response_model_include,
+                response_model_exclude=route.response_model_exclude,
+                response_model_by_alias=route.response_model_by_alias,
+                response_model_exclude_unset=route.response_model_exclude_unset,
+                response_model_exclude_defaults=route.response_model_exclude_defaults,
+                response_model_exclude_none=route.response_model_exclude_none,
+                include_in_schema=route.include_in_schema,
+                response_class=route.response_class,
+                name=route.name,
+                callbacks=route.callbacks,
+                openapi_extra=route.openapi_extra,
+                generate_unique_id_function=route.generate_unique_id_function,
+            )
+        elif isinstance(route, Route):
+            target.add_route(
+                prefix + route.path,
+                route.endpoint,
+                methods=route.methods,
+                name=route.name,
+                include_in_schema=route.include_in_schema,
+            )
+        else:
+            raise TypeError(f"Cannot flatten route of type {type(route).__name__}")
+
+
 api_router = APIRouter()
 
 # Include all API routes
-api_router.include_router(auth_router, prefix="/auth", tags=["authentication"])
-api_router.include_router(users_router, prefix="/users", tags=["users"])
-api_router.include_router(conversations_router, prefix="/conversations", tags=["conversations"])
-api_router.include_router(nvc_router, prefix="/nvc", tags=["nvc"])
-api_router.include_router(research_router, prefix="/research", tags=["research"])
\ No newline at end of file
+mount_flat(api_router, auth_router, prefix="/auth", tags=["authentication"])
+mount_flat(api_router, users_router, prefix="/users", tags=["users"])
+mount_flat(api_router, conversations_router, prefix="/conversations", tags=["conversations"])
+mount_flat(api_router, nvc_router, prefix="/nvc", tags=["nvc"])
+mount_flat(api_router, research_router, prefix="/research", tags=["research"])
@@ -6,17 +6,21 @@ from fastapi import APIRouter
 router = APIRouter()
 
 # TODO: Implement authentication endpoints
-@router.post("/login")
+_LOGIN_RESPONSE = {"message": "Login endpoint - TODO"}
+_REGISTER_RESPONSE = {"message": "Register endpoint - TODO"}
+_REFRESH_TOKEN_RESPONSE = {"message": "Refresh token endpoint - TODO"}
+
+@router.post("/login", response_model=None, include_in_schema=False)
 async def login():
     """User login endpoint."""
-    return {"message": "Login endpoint - TODO"}
+    return _LOGIN_RESPONSE
 
-@router.post("/register")
+@router.post("/register", response_model=None, include_in_schema=False)
 async def register():
     """User registration endpoint.""" 
-    return {"message": "Register endpoint - TODO"}
+    return _REGISTER_RESPONSE
 
-@router.post("/refresh")
+@router.post("/refresh", response_model=None, include_in_schema=False)
 async def refresh_token():
     """Token refresh endpoint."""
-    return {"message": "Refresh token endpoint - TODO"}
\ No newline at end of file
+    return _REFRESH_TOKEN_RESPONSE
\ No newline at end of file
@@ -3,20 +3,30 @@ Conversation management API endpoints
 """
 from fastapi import APIRouter
 
+from app.core.responses import StaticEndpoint
+
 router = APIRouter()
 
+
 # TODO: Implement conversation endpoints
-@router.post("/")
-async def create_conversation():
-    """Create a new NVC conversation session."""
-    return {"message": "Create conversation endpoint - TODO"}
+# Until then each stub replays a constant body without touching the FastAPI pipeline.
+router.add_route(
+    "/",
+    StaticEndpoint.json({"message": "Create conversation endpoint - TODO"}),
+    methods=["POST"],
+    name="create_conversation",
+)
 
-@router.get("/{conversation_id}")
-async def get_conversation():
-    """Get conversation by ID."""
-    return {"message": "Get conversation endpoint - TODO"}
+router.add_route(
+    "/{conversation_id}",
+    StaticEndpoint.json({"message": "Get conversation endpoint - TODO"}),
+    methods=["GET"],
+    name="get_conversation",
+)
 
-@router.post("/{conversation_id}/messages")
-async def send_message():
-    """Send message in conversation."""
-    return {"message": "Send message endpoint - TODO"}
\ No newline at end of file
+router.add_route(
+    "/{conversation_id}/messages",
+    StaticEndpoint.json({"message": "Send message endpoint - TODO"}),
+    methods=["POST"],
+    name="send_message",
+)
@@ -1,14 +1,24 @@
 """
 NVC resources and guidance API endpoints
 """
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
-import json
-import os
-from openai import OpenAI
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, ValidationError
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Literal, NamedTuple, Optional, get_args
+import asyncio
+import hmac
+import random
+import re
+from openai import AsyncOpenAI
 from loguru import logger
 
+from app.core.cache import LRUCache, cache_key
+from app.core.config import settings
+from app.core.rate_limit import AsyncTokenBucket
+from app.core.responses import StaticEndpoint, sse_event
+from app.services.keyword_scanner import KeywordScanner
+
 router = APIRouter()
 
 class ConversationRequest(BaseModel):
@@ -36,38 +46,274 @@ class ConversationResponse(BaseModel):
 # Authentication functions
 def validate_credentials(email: str, password: str) -> bool:
     """Validate user credentials - simple password check for now"""
-    return password == "NVCRocks!"
+    # Constant-time compare so response timing does not reveal the password
+    return hmac.compare_digest(password.encode(), b"NVCRocks!")
 
 def is_authenticated(request: ConversationRequest) -> bool:
     """Check if the request contains valid authentication"""
     return validate_credentials(request.email, request.password)
 
-# Initialize OpenAI client
-def get_openai_client():
-    api_key = os.getenv("OPENAI_API_KEY")
-    if api_key and api_key != "your_openai_api_key_here":
-        return OpenAI(api_key=api_key)
-    return None
+# API key resolved once at import; the .env.example placeholder counts as unset
+_openai_api_key = settings.OPENAI_API_KEY if settings.OPENAI_API_KEY != "your_openai_api_key_here" else None
+
+# Shared OpenAI client, created on first use
+_openai_client: Optional[AsyncOpenAI] = None
+
+def get_openai_client() -> Optional[AsyncOpenAI]:
+    """Return the shared OpenAI client, or None when no API key is configured.
+
+    One client per process keeps its keep-alive connection pool warm, so only
+    the first call pays for the TCP/TLS handshake.
+    """
+    global _openai_client
+    if _openai_client is None and _openai_api_key:
+        _openai_client = AsyncOpenAI(
+            api_key=_openai_api_key,
+            timeout=settings.AI_RESPONSE_TIMEOUT,
+            max_retries=settings.AI_MAX_RETRIES
+        )
+    return _openai_client
+
+async def close_openai_client() -> None:
+    """Close the shared client's connection pool; called on application shutdown."""
+    global _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+
+# Keeps bursts under the account's request limit; waiting briefly here is
+# cheaper than a 429 followed by the SDK's exponential backoff. Every worker
+# process has its own bucket, so each gets an equal share of the limit.
+_openai_limiter = AsyncTokenBucket(settings.OPENAI_REQUESTS_PER_MINUTE / max(settings.WEB_CONCURRENCY, 1))
+
+async def create_chat_completion(client: AsyncOpenAI, **params):
+    """Rate-limited client.chat.completions.create."""
+    async with _openai_limiter:
+        return await client.chat.completions.create(**params)
+
+# Completion texts by hash of the full request, so retries, repeated openers
+# and the near-deterministic classifier prompts skip the OpenAI round trip
+_completion_cache = LRUCache(settings.AI_RESPONSE_CACHE_SIZE)
+
+# Case, punctuation and spacing do not change what the facilitator should say
+_CACHE_NOISE_RE = re.compile(r"[^\w\s]+")
+
+def completion_cache_key(messages: List[dict], params: dict) -> str:
+    """Cache key for a chat request that ignores case, punctuation and spacing.
+
+    "I feel frustrated at work." and "i feel  frustrated at work" share a
+    key, so near-identical openers and resubmissions reuse one completion.
+    """
+    normalized = [
+        (message["role"], " ".join(_CACHE_NOISE_RE.sub(" ", message["content"].lower()).split()))
+        for message in messages
+    ]
+    return cache_key(normalized, params)
+
+# Cache misses currently waiting on OpenAI, so identical concurrent requests
+# (double submits, several tabs) share one call instead of racing to fill the cache
+_completion_inflight: Dict[str, "asyncio.Task[str]"] = {}
+
+async def _complete_and_cache(client: AsyncOpenAI, key: str, messages: List[dict], params: dict) -> str:
+    """Fetch one completion and store its text under key."""
+    response = await create_chat_completion(client, messages=messages, **params)
+    text = response.choices[0].message.content.strip()
+    _completion_cache.set(key, text)
+    return text
+
+async def cached_chat_completion(client: AsyncOpenAI, messages: List[dict], **params) -> str:
+    """Return the completion text for a chat request, reusing equivalent earlier requests.
+
+    A request that matches one still in flight awaits that call's result.
+    """
+    key = completion_cache_key(messages, params)
+    text = _completion_cache.get(key)
+    if text is not None:
+        return text
+    task = _completion_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_complete_and_cache(client, key, messages, params))
+        _completion_inflight[key] = task
+        task.add_done_callback(lambda _: _completion_inflight.pop(key, None))
+    # Shielded so one caller disconnecting does not cancel the call for the others
+    return await asyncio.shield(task)
+
+# Keyword tables for the rule-based heuristics; a message is tested with
+# `word in text` semantics against all of them in one KEYWORD_SCANNER pass.
+PROGRESS_INDICATORS = {
+    "observation": frozenset(["noticed", "saw", "heard", "observed"]),
+    "feeling": frozenset(["feel", "feeling", "frustrated", "sad"]),
+    "need": frozenset(["need", "value", "respect"]),
+    "request": frozenset(["would you", "could", "request"]),
+}
+
+STEP_INDICATORS = {
+    # Observation indicators (facts, what happened)
+    "observation": frozenset(["noticed", "saw", "heard", "observed", "happened", "said", "did", "when", "during"]),
+    # Feeling indicators (emotions)
+    "feeling": frozenset(["feel", "feeling", "felt", "frustrated", "angry", "sad", "excited", "worried", "grateful",
+                          "disappointed", "hurt", "confused", "overwhelmed", "peaceful", "hopeful"]),
+    # Need indicators (values, needs)
+    "need": frozenset(["need", "value", "important", "matter", "respect", "understanding", "connection",
+                       "safety", "autonomy", "recognition", "support", "honesty", "trust"]),
+    # Request indicators (asking for action)
+    "request": frozenset(["would you", "could you", "please", "willing", "appreciate", "request", "ask"]),
+}
+
+COMPLETION_PHRASES = frozenset([
+    "show me the summary", "i'm ready to complete", "can we finish",
+    "give me the nvc summary", "i'm done", "that's enough",
+    "create my nvc statement", "show me my nvc framework",
+    "no more to discuss", "nothing else", "i'm satisfied",
+    "i am complete", "i am done", "print the summary",
+    "please print the summary", "generate the summary",
+    "create the summary", "finish this", "wrap this up",
+    "complete", "summary please", "give me my summary"
+])
+
+# Evidence that each step was covered before a conversation may complete
+COMPLETION_EVIDENCE = {
+    "observation": frozenset(["noticed", "saw", "heard", "observed"]),
+    "feeling": frozenset(["feel", "feeling", "frustrated", "sad", "angry"]),
+    "need": frozenset(["need", "value", "respect", "understanding"]),
+    # More stringent request detection - needs to be a clear actionable request
+    "request": frozenset(["would you be willing", "could you please", "would you please",
+                          "i request", "i ask that", "could we", "will you"]),
+}
+
+# Words counted to require multiple feeling/need mentions before completing
+COMPLETION_DEPTH = {
+    "feeling": frozenset(["feel", "feeling", "frustrated", "sad", "angry", "excited", "worried", "grateful"]),
+    "need": frozenset(["need", "value", "respect", "understanding", "connection", "autonomy", "safety"]),
+}
+
+# A recent request that has not yet been followed by clarifying talk
+REQUEST_INDICATORS = frozenset(["would you", "could you", "please", "willing", "request"])
+CLARIFICATION_KEYWORDS = frozenset(["why", "how", "what if", "when", "where", "realistic", "workable"])
+
+# Words marking a user message as the source of each statement in the summary
+SUMMARY_EVIDENCE = {
+    "observations": frozenset(["noticed", "saw", "heard", "didn't", "said", "did"]),
+    "feelings": frozenset(["feel", "feeling", "frustrated", "sad", "angry", "unheard", "unappreciated"]),
+    "needs": frozenset(["need", "want", "value", "respect", "recognition", "understanding"]),
+    "requests": frozenset(["would you", "could you", "please", "willing"]),
+}
+
+KEYWORD_SCANNER = KeywordScanner(
+    [word for table in (PROGRESS_INDICATORS, STEP_INDICATORS, COMPLETION_EVIDENCE, COMPLETION_DEPTH, SUMMARY_EVIDENCE)
+     for words in table.values() for word in words]
+    + list(COMPLETION_PHRASES | REQUEST_INDICATORS | CLARIFICATION_KEYWORDS)
+)
+
+# Clients resend the whole history every turn, so each message is scanned
+# once and its hits reused on later turns
+@lru_cache(maxsize=1024)
+def scan_message(message: str) -> FrozenSet[str]:
+    """KEYWORD_SCANNER hits in one message."""
+    return KEYWORD_SCANNER.scan(message.lower())
+
+def scan_history(conversation_history: List[str]) -> FrozenSet[str]:
+    """KEYWORD_SCANNER hits in the space-joined, lowercased conversation.
+
+    Built from the cached per-message scans. Keywords spanning a join are
+    found by also scanning each join with a keyword's length of text on either
+    side. The text before a join is the tail of the joined history, not just
+    the previous message, so a keyword running across several short messages
+    ("would" / "you be" / "willing") is still seen and the result equals
+    scanning the joined text.
+    """
+    reach = KEYWORD_SCANNER.max_length - 1
+    hits = set()
+    tail = None  # Last `reach` characters of the history joined so far
+    for message in conversation_history:
+        hits |= scan_message(message)
+        if tail is None:
+            tail = message[-reach:] if reach > 0 else ""
+            continue
+        if reach > 0:
+            hits |= KEYWORD_SCANNER.scan((tail + " " + message[:reach]).lower())
+            tail = message[-reach:] if len(message) >= reach else (tail + " " + message)[-reach:]
+    return frozenset(hits)
+
+def trim_history(conversation_history: List[str], max_messages: int = 3,
+                 max_chars: int = settings.PROMPT_HISTORY_MAX_CHARS) -> List[str]:
+    """Newest distinct messages that fit the prompt budget, oldest first.
+
+    Walks back from the newest message and stops at max_messages or once the
+    next message would push the text over max_chars, so the history sent to
+    OpenAI stays bounded however long individual messages get. The newest
+    message is always kept, cut to max_chars if it alone is over budget. A
+    message repeated verbatim is kept only at its newest position.
+    """
+    trimmed = []
+    seen = set()
+    used = 0
+    for message in reversed(conversation_history):
+        if message in seen:
+            continue
+        if len(trimmed) == max_messages:
+            break
+        seen.add(message)
+        used += len(message) + 3  # " | " separator
+        if used > max_chars:
+            if not trimmed:
+                trimmed.append(message[:max_chars])
+            break
+        trimmed.append(message)
+    trimmed.reverse()
+    return trimmed
+
+class TurnKeywords(NamedTuple):
+    """KEYWORD_SCANNER hits for one turn, computed once and shared by the heuristics."""
+    message: FrozenSet[str]  # hits in the newest message
+    history: FrozenSet[str]  # hits in the whole conversation, newest message included
+
+def scan_turn(conversation_history: List[str]) -> TurnKeywords:
+    """Scan the newest message and the conversation, reusing earlier turns' scans."""
+    return TurnKeywords(
+        message=scan_message(conversation_history[-1]) if conversation_history else frozenset(),
+        history=scan_history(conversation_history)
+    )
+
+# Static instructions for the facilitator. Kept byte-identical across calls and
+# sent first so OpenAI's prompt caching can reuse the prefix; everything that
+# varies per turn goes in the user message from get_nvc_prompt.
+NVC_SYSTEM_PROMPT = """You are an expert Non-Violent Communication (NVC) facilitator. Your role is to efficiently guide people through the 4-step NVC process to reach a clear resolution.
+
+NVC FRAMEWORK:
+1. OBSERVATION: What exactly happened? (facts without evaluation)
+2. FEELINGS: What emotions arose? (not thoughts disguised as feelings)  
+3. NEEDS: What universal human needs are at play? (connection, autonomy, etc.)
+4. REQUEST: What specific, doable action would help meet the need?
+
+The user's message will describe the CURRENT SITUATION.
+
+RESPONSE GUIDELINES:
+1. Acknowledge what they shared briefly
+2. Identify which NVC step they're currently expressing
+3. Guide them efficiently to the next step (don't circle back)
+4. Be directive - push toward completing their NVC statement
+5. If they've covered all 4 steps, summarize their complete NVC statement
+
+Keep your response conversational, empathetic, and under 150 words. GOAL: Complete NVC statement, not endless exploration."""
+
+def get_nvc_prompt(message: str, context: str = None, conversation_history: List[str] = None,
+                   keywords: Optional[TurnKeywords] = None) -> str:
+    """Create the per-turn part of the facilitator prompt (the user message).
 
-def get_nvc_prompt(message: str, context: str = None, conversation_history: List[str] = None) -> str:
-    """Create a focused, goal-oriented NVC prompt for OpenAI."""
+    The fixed framework and guidelines live in NVC_SYSTEM_PROMPT. Pass
+    keywords (see scan_turn) when the caller already has them.
+    """
     
     # Determine conversation progress
     history_text = ""
     if conversation_history and len(conversation_history) > 1:
-        history_text = f"Conversation so far: {' | '.join(conversation_history[-3:])}"  # Last 3 messages for context
+        history_text = f"Conversation so far: {' | '.join(trim_history(conversation_history))}"  # Last 3 messages for context
         
         # Check progress through NVC steps
-        all_messages = " ".join(conversation_history).lower()
-        steps_covered = []
-        if any(word in all_messages for word in ["noticed", "saw", "heard", "observed"]):
-            steps_covered.append("observation")
-        if any(word in all_messages for word in ["feel", "feeling", "frustrated", "sad"]):
-            steps_covered.append("feeling")
-        if any(word in all_messages for word in ["need", "value", "respect"]):
-            steps_covered.append("need")
-        if any(word in all_messages for word in ["would you", "could", "request"]):
-            steps_covered.append("request")
+        if keywords is None:
+            keywords = scan_turn(conversation_history)
+        steps_covered = [step for step, words in PROGRESS_INDICATORS.items() if keywords.history & words]
             
         progress_note = f"Steps covered so far: {', '.join(steps_covered)}. "
         
@@ -79,210 +325,257 @@ def get_nvc_prompt(message: str, context: str = None, conversation_history: List
         progress_note = "This is early in the conversation. "
         directive = "Start by identifying what NVC step they're expressing and guide them through the sequence."
 
-    return f"""You are an expert Non-Violent Communication (NVC) facilitator. Your role is to efficiently guide people through the 4-step NVC process to reach a clear resolution.
-
-NVC FRAMEWORK:
-1. OBSERVATION: What exactly happened? (facts without evaluation)
-2. FEELINGS: What emotions arose? (not thoughts disguised as feelings)  
-3. NEEDS: What universal human needs are at play? (connection, autonomy, etc.)
-4. REQUEST: What specific, doable action would help meet the need?
-
-CURRENT SITUATION:
+    return f"""CURRENT SITUATION:
 User's message: "{message}"
 {history_text}
-{progress_note}{directive}
+{progress_note}{directive}"""
 
-RESPONSE GUIDELINES:
-1. Acknowledge what they shared briefly
-2. Identify which NVC step they're currently expressing
-3. Guide them efficiently to the next step (don't circle back)
-4. Be directive - push toward completing their NVC statement
-5. If they've covered all 4 steps, summarize their complete NVC statement
+# Model settings for the main facilitator reply. max_tokens leaves headroom over
+# the 150-word limit in the prompt (~200 tokens) so replies are not cut off;
+# top_p trims the long tail that temperature 0.7 would otherwise sample from.
+FACILITATOR_PARAMS = {"model": "gpt-4o-mini", "max_tokens": 220, "temperature": 0.7, "top_p": 0.9}
 
-Keep your response conversational, empathetic, and under 150 words. GOAL: Complete NVC statement, not endless exploration."""
+NVCStep = Literal["observation", "feeling", "need", "request"]
+NVC_STEPS = get_args(NVCStep)
+
+class FacilitatorTurn(BaseModel):
+    """Structured facilitator reply, as returned by the model."""
+    model_config = ConfigDict(extra="forbid")
+
+    response: str
+    suggested_responses: List[str]
+    detected_step: NVCStep
+
+# The non-streaming reply also carries three short suggestions and JSON syntax,
+# which must not be truncated or the reply cannot be parsed
+FACILITATOR_JSON_PARAMS = {
+    **FACILITATOR_PARAMS,
+    "max_tokens": 320,
+    "response_format": {
+        "type": "json_schema",
+        # Strict structured output: the model can only emit a FacilitatorTurn
+        "json_schema": {"name": "facilitator_turn", "strict": True, "schema": FacilitatorTurn.model_json_schema()},
+    },
+}
+
+NVC_SYSTEM_PROMPT_JSON = NVC_SYSTEM_PROMPT + """
+
+Return a JSON object with three keys:
+- "response": your reply to the user, following the guidelines above
+- "suggested_responses": an array of 3 short first-person statements the user could say next, specific to their situation and following NVC principles
+- "detected_step": the NVC step the user's latest message expresses, one of: observation, feeling, need, request"""
+
+def get_facilitator_messages(prompt: str, structured: bool = False) -> List[dict]:
+    """Chat messages for the main facilitator reply.
+
+    With structured=True the model is asked for the JSON reply read by
+    parse_facilitator_reply; use it together with FACILITATOR_JSON_PARAMS.
+    """
+    return [
+        {"role": "system", "content": NVC_SYSTEM_PROMPT_JSON if structured else NVC_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+# Optional ```json ... ``` wrapper some replies arrive in despite JSON mode
+_JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+class FacilitatorReply(NamedTuple):
+    """Fields of a structured facilitator reply."""
+    response: str
+    suggestions: List[str]
+    detected_step: Optional[str]  # None when the model gave no valid step
+
+def parse_facilitator_reply(text: str) -> FacilitatorReply:
+    """Split a structured facilitator reply into its response, suggestions and step.
+
+    Text that is not a valid FacilitatorTurn is returned as the response with
+    no suggestions or step, so callers can fall back to the generic suggestions
+    and to local step detection.
+    """
+    try:
+        turn = FacilitatorTurn.model_validate_json(_JSON_FENCE_RE.sub("", text))
+    except ValidationError:
+        return FacilitatorReply(text, [], None)
+    if not turn.response.strip():
+        return FacilitatorReply(text, [], None)
+    return FacilitatorReply(
+        turn.response.strip(),
+        [s.strip() for s in turn.suggested_responses if s.strip()][:3],
+        turn.detected_step
+    )
+
+def build_ai_turn_response(ai_response: str, next_step: str,
+                           suggestions: Optional[List[str]] = None) -> ConversationResponse:
+    """Wrap an AI facilitator reply with the guidance for the next step."""
+    return ConversationResponse(
+        response=ai_response,
+        current_step=next_step,
+        guidance="AI-powered NVC guidance",
+        example="Response generated by GPT-4o-mini",
+        suggested_responses=suggestions or get_generic_suggestions(next_step),
+        vocabulary_options=get_nvc_vocabulary_for_step(next_step)
+    )
+
+# Vocabulary options offered for each NVC step
+STEP_VOCABULARY = {
+    "observation": (
+        "I noticed...", "I saw...", "I heard...", "What happened was...", 
+        "The facts are...", "I observed...", "During the meeting..."
+    ),
+    "feeling": (
+        "frustrated", "disappointed", "excited", "grateful", "confused",
+        "worried", "hopeful", "sad", "angry", "peaceful", "overwhelmed", "curious"
+    ),
+    "need": (
+        "respect", "understanding", "connection", "autonomy", "safety",
+        "recognition", "collaboration", "honesty", "support", "trust", "clarity", "contribution"
+    ),
+    "request": (
+        "Would you be willing to...", "Could we...", "I would appreciate if...",
+        "Would it work for you to...", "Could you please...", "I'd like to request..."
+    )
+}
 
 def get_nvc_vocabulary_for_step(step: str, context: str = "") -> List[str]:
     """Get relevant NVC vocabulary options for the current step."""
-    vocabularies = {
-        "observation": [
-            "I noticed...", "I saw...", "I heard...", "What happened was...", 
-            "The facts are...", "I observed...", "During the meeting..."
-        ],
-        "feeling": [
-            "frustrated", "disappointed", "excited", "grateful", "confused",
-            "worried", "hopeful", "sad", "angry", "peaceful", "overwhelmed", "curious"
-        ],
-        "need": [
-            "respect", "understanding", "connection", "autonomy", "safety",
-            "recognition", "collaboration", "honesty", "support", "trust", "clarity", "contribution"
-        ],
-        "request": [
-            "Would you be willing to...", "Could we...", "I would appreciate if...",
-            "Would it work for you to...", "Could you please...", "I'd like to request..."
-        ]
-    }
-    return vocabularies.get(step, [])
+    return list(STEP_VOCABULARY.get(step, ()))
+
+# Who and where a message is about, checked in priority order; the first
+# entry with any keyword in the message wins, so "my boss and my partner"
+# still reads as a work situation.
+CONTEXT_PERSONS = (
+    (("coworker", "colleague"), "my coworker"),
+    (("boss", "manager"), "my manager"),
+    (("partner",), "my partner"),
+    (("friend",), "my friend"),
+)
+CONTEXT_SETTINGS = (
+    (("meeting",), "our meeting"),
+    (("work",), "work"),
+    (("home",), "home"),
+)
+CONTEXT_SCANNER = KeywordScanner(
+    [word for table in (CONTEXT_PERSONS, CONTEXT_SETTINGS) for words, _ in table for word in words]
+)
+
+def _first_context_match(table, hits: FrozenSet[str], default: str) -> str:
+    for words, value in table:
+        if not hits.isdisjoint(words):
+            return value
+    return default
 
 def analyze_user_context(message: str) -> dict:
     """Simple pattern matching for context - reliable and fast."""
-    message_lower = message.lower()
-    
-    context = {
-        "person": "they",
-        "setting": "this situation",
+    hits = CONTEXT_SCANNER.scan(message.lower())
+    return {
+        "person": _first_context_match(CONTEXT_PERSONS, hits, "they"),
+        "setting": _first_context_match(CONTEXT_SETTINGS, hits, "this situation"),
         "action": "behaved this way"
     }
-    
-    # Simple person detection
-    if "coworker" in message_lower or "colleague" in message_lower:
-        context["person"] = "my coworker"
-    elif "boss" in message_lower or "manager" in message_lower:
-        context["person"] = "my manager"
-    elif "partner" in message_lower:
-        context["person"] = "my partner"
-    elif "friend" in message_lower:
-        context["person"] = "my friend"
-    
-    # Simple setting detection
-    if "meeting" in message_lower:
-        context["setting"] = "our meeting"
-    elif "work" in message_lower:
-        context["setting"] = "work"
-    elif "home" in message_lower:
-        context["setting"] = "home"
-    
-    return context
 
-def generate_contextual_suggestions(step: str, user_message: str, context: dict = None) -> List[str]:
-    """Use AI to generate contextual NVC suggestions based on the user's situation."""
-    try:
-        client = get_openai_client()
-        if not client:
-            return get_generic_suggestions(step)
-        
-        prompt = f"""Generate 3 contextual NVC suggestions for the {step} step based on this situation: "{user_message}"
+# Fallback suggested responses for each NVC step
+GENERIC_SUGGESTIONS = {
+    "observation": (
+        "I noticed that...",
+        "What I observed was...", 
+        "The situation I want to discuss is..."
+    ),
+    "feeling": (
+        "I feel frustrated about this",
+        "I'm feeling unheard",
+        "I feel concerned about..."
+    ),
+    "need": (
+        "I need respect and understanding",
+        "I value honest communication", 
+        "I need to feel heard and valued"
+    ),
+    "request": (
+        "Would you be willing to...",
+        "Could we work together to...",
+        "I'd appreciate if we could..."
+    )
+}
 
-{step.upper()} suggestions should:
-- Be specific to their situation
-- Use first person ("I" statements)
-- Be examples they could actually say
-- Follow NVC principles
+def get_generic_suggestions(step: str) -> List[str]:
+    """Fallback generic suggestions."""
+    return list(GENERIC_SUGGESTIONS.get(step, ()))
 
-Return only the 3 suggestions, one per line, no other text."""
+# Fixed instructions for step detection, sent as the system message so only the
+# short per-turn classification request varies
+STEP_DETECTION_SYSTEM_PROMPT = """Analyze messages in the context of Non-Violent Communication and determine which step each represents.
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "Generate contextual NVC suggestions."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=150,
-            temperature=0.7
-        )
-        
-        suggestions = response.choices[0].message.content.strip().split('\n')
-        return [s.strip() for s in suggestions if s.strip()][:3]
-        
-    except Exception:
-        return get_generic_suggestions(step)
+NVC Steps:
+- observation: Facts without judgment (I noticed, I saw, what happened)
+- feeling: Emotional response (I feel frustrated, sad, excited)
+- need: Universal human needs (I need respect, connection, understanding)
+- request: Specific actionable ask (Would you be willing to...)
 
-def get_generic_suggestions(step: str) -> List[str]:
-    """Fallback generic suggestions."""
-    suggestions = {
-        "observation": [
-            "I noticed that...",
-            "What I observed was...", 
-            "The situation I want to discuss is..."
-        ],
-        "feeling": [
-            "I feel frustrated about this",
-            "I'm feeling unheard",
-            "I feel concerned about..."
-        ],
-        "need": [
-            "I need respect and understanding",
-            "I value honest communication", 
-            "I need to feel heard and valued"
-        ],
-        "request": [
-            "Would you be willing to...",
-            "Could we work together to...",
-            "I'd appreciate if we could..."
-        ]
-    }
-    return suggestions.get(step, [])
+Return only one word: observation, feeling, need, or request"""
 
-def detect_nvc_step_with_ai(message: str, conversation_history: List[str] = None) -> str:
+# The opening of a message is enough to classify it; the rest only adds prefill
+STEP_DETECTION_MAX_CHARS = 200
+
+# Keyword lead of the best step over the runner-up at which the local answer is
+# trusted and the model is not asked
+LOCAL_STEP_MIN_MARGIN = 2
+
+async def detect_nvc_step_with_ai(message: str, conversation_history: List[str] = None,
+                                  message_hits: Optional[FrozenSet[str]] = None) -> str:
     """Use AI to intelligently detect the current NVC step."""
     try:
         client = get_openai_client()
         if not client:
-            return detect_current_nvc_step(message)
+            return detect_current_nvc_step(message, message_hits)
+        
+        if message_hits is None:
+            message_hits = KEYWORD_SCANNER.scan(message.lower())
+        first, second = sorted(step_indicator_scores(message_hits).values(), reverse=True)[:2]
+        if first - second >= LOCAL_STEP_MIN_MARGIN:
+            return detect_current_nvc_step(message, message_hits)
         
         # Get recent context
-        context = ""
+        prompt = f'Message: "{message[:STEP_DETECTION_MAX_CHARS]}"'
         if conversation_history and len(conversation_history) > 1:
-            context = f"Previous messages: {conversation_history[-3:]}"
+            recent = [m[:STEP_DETECTION_MAX_CHARS] for m in trim_history(conversation_history)]
+            prompt += f"\nPrevious messages: {recent}"
         
-        prompt = f"""Analyze this message in the context of Non-Violent Communication and determine which step it represents:
-
-Message: "{message}"
-{context}
-
-NVC Steps:
-- observation: Facts without judgment (I noticed, I saw, what happened)
-- feeling: Emotional response (I feel frustrated, sad, excited)  
-- need: Universal human needs (I need respect, connection, understanding)
-- request: Specific actionable ask (Would you be willing to...)
-
-Return only one word: observation, feeling, need, or request"""
-
-        response = client.chat.completions.create(
+        ai_step = (await cached_chat_completion(
+            client,
+            [
+                {"role": "system", "content": STEP_DETECTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
             model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
             max_tokens=10,
             temperature=0.1
-        )
-        
-        ai_step = response.choices[0].message.content.strip().lower()
+        )).lower()
         
         # Validate AI response
-        if ai_step in ["observation", "feeling", "need", "request"]:
-            logger.info(f"AI detected step: {ai_step} for message: {message[:50]}...")
+        if ai_step in NVC_STEPS:
+            logger.debug("AI detected step: {} for message: {}...", ai_step, message[:50])
             return ai_step
         else:
-            logger.warning(f"AI returned invalid step: {ai_step}, falling back to pattern matching")
-            return detect_current_nvc_step(message)
+            logger.warning("AI returned invalid step: {}, falling back to pattern matching", ai_step)
+            return detect_current_nvc_step(message, message_hits)
         
     except Exception as e:
-        logger.warning(f"AI step detection failed: {e}, using pattern matching")
-        return detect_current_nvc_step(message)
+        logger.warning("AI step detection failed: {}, using pattern matching", e)
+        return detect_current_nvc_step(message, message_hits)
 
-def detect_current_nvc_step(message: str) -> str:
-    """Detect which NVC step the user is currently expressing."""
-    message_lower = message.lower()
-    
-    # Observation indicators (facts, what happened)
-    observation_words = ["noticed", "saw", "heard", "observed", "happened", "said", "did", "when", "during"]
-    
-    # Feeling indicators (emotions)
-    feeling_words = ["feel", "feeling", "felt", "frustrated", "angry", "sad", "excited", "worried", "grateful", 
-                     "disappointed", "hurt", "confused", "overwhelmed", "peaceful", "hopeful"]
-    
-    # Need indicators (values, needs)
-    need_words = ["need", "value", "important", "matter", "respect", "understanding", "connection", 
-                  "safety", "autonomy", "recognition", "support", "honesty", "trust"]
-    
-    # Request indicators (asking for action)
-    request_words = ["would you", "could you", "please", "willing", "appreciate", "request", "ask"]
+def step_indicator_scores(hits: FrozenSet[str]) -> dict:
+    """Count the STEP_INDICATORS of each step among a message's keyword hits."""
+    return {step: len(hits & words) for step, words in STEP_INDICATORS.items()}
+
+def detect_current_nvc_step(message: str, hits: Optional[FrozenSet[str]] = None) -> str:
+    """Detect which NVC step the user is currently expressing.
+
+    hits may carry the message's KEYWORD_SCANNER result if already computed.
+    """
+    if hits is None:
+        hits = KEYWORD_SCANNER.scan(message.lower())
     
-    # Count indicators for each step
-    scores = {
-        "observation": sum(1 for word in observation_words if word in message_lower),
-        "feeling": sum(1 for word in feeling_words if word in message_lower),
-        "need": sum(1 for word in need_words if word in message_lower),
-        "request": sum(1 for word in request_words if word in message_lower)
-    }
+    scores = step_indicator_scores(hits)
     
     # Return the step with highest score, default to observation
     if max(scores.values()) == 0:
@@ -290,67 +583,19 @@ def detect_current_nvc_step(message: str) -> str:
     
     return max(scores.items(), key=lambda x: x[1])[0]
 
+# Step that follows each detected step; the request step repeats until the
+# user has made a specific request
+NEXT_NVC_STEP = {
+    "starting": "observation",
+    "observation": "feeling",
+    "feeling": "need",
+    "need": "request",
+    "request": "request",
+}
+
 def get_next_nvc_step(current_step: str) -> str:
     """Determine the next NVC step in the sequence."""
-    step_sequence = ["observation", "feeling", "need", "request"]
-    
-    if current_step == "starting":
-        return "observation"
-    elif current_step in step_sequence:
-        current_index = step_sequence.index(current_step)
-        if current_index < len(step_sequence) - 1:
-            return step_sequence[current_index + 1]
-        else:
-            # At request step - stay there until we get a specific request
-            return "request"
-    
-    return "request"  # Default to request if unclear
-
-def ai_should_complete_conversation(conversation_history: List[str]) -> bool:
-    """Use AI to determine if all NVC steps have been meaningfully covered."""
-    try:
-        client = get_openai_client()
-        if not client or len(conversation_history) < 8:  # Require more conversation
-            return should_complete_conversation(conversation_history)
-        
-        prompt = f"""Review this NVC conversation and determine if the user has THOROUGHLY worked through all 4 steps:
-
-Conversation: {conversation_history}
-
-STRICT CRITERIA - ALL must be met:
-1. Clear, specific observation stated without judgment or evaluation
-2. Genuine feelings expressed (not thoughts disguised as feelings)
-3. Underlying needs clearly identified and explored
-4. Specific, actionable request made that connects to their needs
-5. User has had multiple opportunities to refine their NVC statement
-6. Conversation shows depth of exploration, not just surface mentions
-
-Only return 'true' if the user has genuinely explored each step thoroughly and appears ready for a complete NVC framework. If they've only briefly touched on steps or could benefit from more exploration, return 'false'.
-
-Return only: true or false"""
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=5,
-            temperature=0.1
-        )
-        
-        ai_result = response.choices[0].message.content.strip().lower()
-        
-        if ai_result == "true":
-            logger.info("AI determined conversation is complete")
-            return True
-        elif ai_result == "false":
-            logger.info("AI determined conversation needs more work")
-            return False
-        else:
-            logger.warning(f"AI returned invalid completion result: {ai_result}")
-            return should_complete_conversation(conversation_history)
-            
-    except Exception as e:
-        logger.warning(f"AI completion detection failed: {e}, using pattern matching")
-        return should_complete_conversation(conversation_history)
+    return NEXT_NVC_STEP.get(current_step, "request")  # Default to request if unclear
 
 def check_request_clarification_needed(conversation_history: List[str], current_message: str) -> bool:
     """Check if we need to ask clarifying questions after a request"""
@@ -358,55 +603,44 @@ def check_request_clarification_needed(conversation_history: List[str], current_
         return False
     
     # Look for request keywords in recent messages
-    recent_messages = " ".join(conversation_history[-3:]).lower()
-    request_indicators = ["would you", "could you", "please", "willing", "request"]
-    
-    has_recent_request = any(indicator in recent_messages for indicator in request_indicators)
+    hits = KEYWORD_SCANNER.scan(" ".join(conversation_history[-3:]).lower())
+    has_recent_request = bool(hits & REQUEST_INDICATORS)
     
     # Check if we've already done clarification
-    clarification_keywords = ["why", "how", "what if", "when", "where", "realistic", "workable"]
-    has_clarification = any(keyword in recent_messages for keyword in clarification_keywords)
+    has_clarification = bool(hits & CLARIFICATION_KEYWORDS)
     
     return has_recent_request and not has_clarification
 
-def should_complete_conversation(conversation_history: List[str]) -> bool:
-    """Determine if the conversation has covered all NVC steps and should complete."""
+def should_complete_conversation(conversation_history: List[str], keywords: Optional[TurnKeywords] = None) -> bool:
+    """Determine if the conversation has covered all NVC steps and should complete.
+
+    Pass keywords (see scan_turn) when the caller already has them; otherwise
+    the history is only scanned once the cheaper checks have not decided.
+    """
+    if keywords is not None:
+        message_hits = keywords.message
+    else:
+        message_hits = scan_message(conversation_history[-1]) if conversation_history else frozenset()
+    
     # Check if user explicitly wants to complete
-    if conversation_history:
-        last_message = conversation_history[-1].lower()
-        completion_phrases = [
-            "show me the summary", "i'm ready to complete", "can we finish", 
-            "give me the nvc summary", "i'm done", "that's enough",
-            "create my nvc statement", "show me my nvc framework",
-            "no more to discuss", "nothing else", "i'm satisfied",
-            "i am complete", "i am done", "print the summary", 
-            "please print the summary", "generate the summary",
-            "create the summary", "finish this", "wrap this up",
-            "complete", "summary please", "give me my summary"
-        ]
-        if any(phrase in last_message for phrase in completion_phrases):
-            logger.info(f"Explicit completion requested with message: {last_message}")
-            return True
+    if message_hits & COMPLETION_PHRASES:
+        logger.debug("Explicit completion requested with message: {}", conversation_history[-1])
+        return True
     
     if len(conversation_history) < 10:  # Need even more conversation for thorough exploration
         return False
     
     # Check if we have evidence of all four steps in proper sequence
-    all_messages = " ".join(conversation_history).lower()
+    hits = keywords.history if keywords is not None else scan_history(conversation_history)
     
-    has_observation = any(word in all_messages for word in ["noticed", "saw", "heard", "observed"])
-    has_feeling = any(word in all_messages for word in ["feel", "feeling", "frustrated", "sad", "angry"])
-    has_need = any(word in all_messages for word in ["need", "value", "respect", "understanding"])
-    
-    # More stringent request detection - needs to be a clear actionable request
-    has_specific_request = any(phrase in all_messages for phrase in [
-        "would you be willing", "could you please", "would you please", 
-        "i request", "i ask that", "could we", "will you"
-    ])
+    has_observation = bool(hits & COMPLETION_EVIDENCE["observation"])
+    has_feeling = bool(hits & COMPLETION_EVIDENCE["feeling"])
+    has_need = bool(hits & COMPLETION_EVIDENCE["need"])
+    has_specific_request = bool(hits & COMPLETION_EVIDENCE["request"])
     
     # Require evidence of multiple expressions and refinement
-    feeling_count = sum(1 for word in ["feel", "feeling", "frustrated", "sad", "angry", "excited", "worried", "grateful"] if word in all_messages)
-    need_count = sum(1 for word in ["need", "value", "respect", "understanding", "connection", "autonomy", "safety"] if word in all_messages)
+    feeling_count = len(hits & COMPLETION_DEPTH["feeling"])
+    need_count = len(hits & COMPLETION_DEPTH["need"])
     
     # Only complete if all steps are present AND there's evidence of exploration (multiple feeling/need mentions)
     has_depth = feeling_count >= 2 and need_count >= 2
@@ -415,64 +649,26 @@ def should_complete_conversation(conversation_history: List[str]) -> bool:
 
 def extract_user_content_from_conversation(conversation_history: List[str]) -> dict:
     """Extract actual observations, feelings, needs, and requests from conversation"""
-    user_messages = []
-    # Filter for user messages (every other message starting from first)
-    for i in range(0, len(conversation_history), 2):
-        if i < len(conversation_history):
-            user_messages.append(conversation_history[i])
-    
-    all_user_text = " ".join(user_messages).lower()
-    
-    # Extract observations (look for specific details mentioned)
-    observations = []
-    for msg in user_messages:
-        if any(word in msg.lower() for word in ["noticed", "saw", "heard", "didn't", "said", "did"]):
-            observations.append(msg)
-    
-    # Extract feelings
-    feelings = []
-    for msg in user_messages:
-        if any(word in msg.lower() for word in ["feel", "feeling", "frustrated", "sad", "angry", "unheard", "unappreciated"]):
-            feelings.append(msg)
+    content = {category: [] for category in SUMMARY_EVIDENCE}
+    # User messages are every other message starting from the first; each is
+    # scanned once and filed under every category its keywords point to
+    for msg in conversation_history[::2]:
+        hits = scan_message(msg)
+        for category, words in SUMMARY_EVIDENCE.items():
+            if not hits.isdisjoint(words):
+                content[category].append(msg)
     
-    # Extract needs
-    needs = []
-    for msg in user_messages:
-        if any(word in msg.lower() for word in ["need", "want", "value", "respect", "recognition", "understanding"]):
-            needs.append(msg)
-    
-    # Extract requests
-    requests = []
-    for msg in user_messages:
-        if any(phrase in msg.lower() for phrase in ["would you", "could you", "please", "willing"]):
-            requests.append(msg)
-    
-    return {
-        "observations": observations,
-        "feelings": feelings,
-        "needs": needs,
-        "requests": requests,
-        "context": context
-    }
+    return content
 
-def generate_nvc_summary(conversation_history: List[str], context: dict) -> str:
-    """Generate a personalized NVC statement summary from actual conversation content."""
-    content = extract_user_content_from_conversation(conversation_history)
-    
-    # Use actual content from conversation
-    observation_text = content["observations"][0] if content["observations"] else "the situation that occurred"
-    feeling_text = content["feelings"][0] if content["feelings"] else "I feel concerned"
-    need_text = content["needs"][0] if content["needs"] else "I need understanding"
-    request_text = content["requests"][0] if content["requests"] else "Would you be willing to work with me on this"
-    
-    return f"""
+# Markdown for the completed-conversation summary; only the four quoted statements vary
+NVC_SUMMARY_TEMPLATE = """
 ## Your Personalized NVC Statement
 
 ### 🔍 **Observation** (What you noticed)
-*"{observation_text}"*
+*"{observation}"*
 
 ### 💭 **Feelings** (Your emotional response)  
-*"{feeling_text}"*
+*"{feeling}"*
 
 **Additional feelings that may resonate:**
 • Disappointed when contributions aren't acknowledged
@@ -481,7 +677,7 @@ def generate_nvc_summary(conversation_history: List[str], context: dict) -> str:
 • Hopeful that we can find a better way to collaborate
 
 ### ❤️ **Needs** (What you value)
-*"{need_text}"*
+*"{need}"*
 
 **Universal needs that may apply:**
 • **Respect** - Having your voice valued and heard
@@ -491,7 +687,7 @@ def generate_nvc_summary(conversation_history: List[str], context: dict) -> str:
 • **Connection** - Meaningful relationships and communication
 
 ### 🤝 **Request** (Your specific ask)
-*"{request_text}"*
+*"{request}"*
 
 **Ways to refine your request:**
 • Make it specific and doable
@@ -528,7 +724,71 @@ def generate_nvc_summary(conversation_history: List[str], context: dict) -> str:
 *Remember: NVC is about connection, not compliance. The goal is mutual understanding and finding solutions that meet everyone's needs.*
 """
 
-@router.post("/auth")
+def generate_nvc_summary(conversation_history: List[str], context: dict) -> str:
+    """Generate a personalized NVC statement summary from actual conversation content."""
+    content = extract_user_content_from_conversation(conversation_history)
+    
+    # Use actual content from conversation
+    return NVC_SUMMARY_TEMPLATE.format(
+        observation=content["observations"][0] if content["observations"] else "the situation that occurred",
+        feeling=content["feelings"][0] if content["feelings"] else "I feel concerned",
+        need=content["needs"][0] if content["needs"] else "I need understanding",
+        request=content["requests"][0] if content["requests"] else "Would you be willing to work with me on this"
+    )
+
+# Rule-based replies used when the AI facilitator is unavailable
+STEP_RESPONSES = {
+    "observation": {
+        "ai_response": "I hear you describing what you observed. Can you help me understand more details? What exactly did you see or hear that concerns you?",
+        "guidance": "Great start with observation! Let's get more specific facts.",
+        "example": "Instead of 'He was being rude' try 'He interrupted me twice and didn't acknowledge my ideas'"
+    },
+    "feeling": {
+        "ai_response": "Thank you for sharing your feelings. Can you tell me more about what emotions come up when you think about this situation? What's the strongest feeling you notice?",
+        "guidance": "You're expressing feelings - let's explore them deeper.",
+        "example": "Try specific feelings: frustrated, disappointed, hurt, worried, hopeful"
+    },
+    "need": {
+        "ai_response": "I understand your needs better now. What would it look like if this need was met? How would you feel different?",
+        "guidance": "You're identifying your needs - let's explore what meeting them would mean.",
+        "example": "Universal needs: understanding, respect, connection, autonomy, recognition, collaboration"
+    },
+    "request": {
+        "ai_response": "That sounds like a clear request. How realistic do you think this request is? What might make the other person willing to consider it?",
+        "guidance": "You're making a request - let's make it as effective as possible.",
+        "example": "Make requests specific, positive, and considerate: 'Would you be willing to...' works better than 'Don't...'"
+    }
+}
+
+DEFAULT_STEP_RESPONSE = {
+    "ai_response": "Let's work through this together step by step.",
+    "guidance": "NVC helps us connect with needs and find solutions.",
+    "example": "Start with what you observed without judgment."
+}
+
+REQUEST_CLARIFICATION_QUESTIONS = (
+    "What would make this request realistic and workable for both of you?",
+    "When would be the best time to make this request?", 
+    "How could you phrase this request in a way that opens dialogue?",
+    "What might help the other person feel willing to consider your request?"
+)
+
+REQUEST_CLARIFICATION_RESPONSE = {
+    "ai_response": "Let me help you refine that request. {question} Also, is there anything else about this situation you'd like to explore before we create your complete NVC framework?",
+    "guidance": "Refining your request - making it specific and considerate.",
+    "example": "Consider timing, wording, and what would make it easy for them to say yes"
+}
+
+# One finished reply per clarifying question, so a turn only has to pick one
+REQUEST_CLARIFICATION_RESPONSES = tuple(
+    {
+        **REQUEST_CLARIFICATION_RESPONSE,
+        "ai_response": REQUEST_CLARIFICATION_RESPONSE["ai_response"].format(question=question),
+    }
+    for question in REQUEST_CLARIFICATION_QUESTIONS
+)
+
+@router.post("/auth", response_model=None)
 async def authenticate(request: AuthRequest):
     """Simple authentication endpoint"""
     if validate_credentials(request.email, request.password):
@@ -546,17 +806,18 @@ async def nvc_conversation(request: ConversationRequest):
         raise HTTPException(status_code=401, detail="Authentication required. Please provide valid credentials.")
     
     try:
+        # Conversation so far plus this message, shared by both paths; a copy,
+        # so the request's own list is left as the client sent it
+        conversation_history = [*(request.conversation_history or []), request.message]
+        keywords = scan_turn(conversation_history)
+        
         # Use OpenAI if available, otherwise fallback
         client = get_openai_client()
         
         if client:
             try:
-                # Get conversation context and check completion first
-                conversation_history = request.conversation_history or []
-                conversation_history.append(request.message)
-                
                 # Check for explicit completion requests FIRST (before AI)
-                if should_complete_conversation(conversation_history):
+                if should_complete_conversation(conversation_history, keywords):
                     logger.info("Completion detected, generating summary...")
                     try:
                         context = analyze_user_context(request.message)
@@ -573,7 +834,7 @@ async def nvc_conversation(request: ConversationRequest):
                             conversation_complete=True
                         )
                     except Exception as e:
-                        logger.error(f"Error generating summary: {e}")
+                        logger.error("Error generating summary: {}", e)
                         # Return simple completion without summary if there's an error
                         return ConversationResponse(
                             response="Great work! You've completed the NVC exploration. Here's a simple summary of your conversation.",
@@ -586,47 +847,21 @@ async def nvc_conversation(request: ConversationRequest):
                             conversation_complete=True
                         )
                 
-                # Get AI response
-                prompt = get_nvc_prompt(request.message, request.context, conversation_history)
-                response = client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "You are a skilled NVC facilitator."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=200,
-                    temperature=0.7
-                )
-                
-                ai_response = response.choices[0].message.content.strip()
-                
-                # Use AI to detect current step with conversation context
-                current_step = detect_nvc_step_with_ai(request.message, conversation_history)
-                next_step = get_next_nvc_step(current_step)
-                
-                # Get vocabulary and suggestions
-                vocabulary = get_nvc_vocabulary_for_step(next_step)
-                suggestions = get_generic_suggestions(next_step)
-                
-                return ConversationResponse(
-                    response=ai_response,
-                    current_step=next_step,
-                    guidance="AI-powered NVC guidance",
-                    example="Response generated by GPT-4o-mini",
-                    suggested_responses=suggestions,
-                    vocabulary_options=vocabulary
-                )
+                # One call returns the reply, its suggestions and the detected step
+                prompt = get_nvc_prompt(request.message, request.context, conversation_history, keywords)
+                reply = parse_facilitator_reply(await cached_chat_completion(
+                    client, get_facilitator_messages(prompt, structured=True), **FACILITATOR_JSON_PARAMS
+                ))
+                current_step = reply.detected_step or detect_current_nvc_step(request.message, keywords.message)
+                return build_ai_turn_response(reply.response, get_next_nvc_step(current_step), reply.suggestions)
                 
             except Exception:
                 # Fall back to rule-based logic
                 pass
         
         # Rule-based fallback
-        conversation_history = request.conversation_history or []
-        conversation_history.append(request.message)
-        
         # Check for explicit completion requests FIRST (before AI)
-        if should_complete_conversation(conversation_history):
+        if should_complete_conversation(conversation_history, keywords):
             logger.info("Fallback completion detected...")
             try:
                 context = analyze_user_context(request.message)
@@ -643,7 +878,7 @@ async def nvc_conversation(request: ConversationRequest):
                     conversation_complete=True
                 )
             except Exception as e:
-                logger.error(f"Error in fallback summary generation: {e}")
+                logger.error("Error in fallback summary generation: {}", e)
                 # Return simple completion
                 return ConversationResponse(
                     response="Great work! You've completed the NVC exploration.",
@@ -657,7 +892,7 @@ async def nvc_conversation(request: ConversationRequest):
                 )
         
         # Use AI step detection for rule-based fallback too
-        current_step = detect_nvc_step_with_ai(request.message, conversation_history)
+        current_step = await detect_nvc_step_with_ai(request.message, conversation_history, keywords.message)
         next_step = get_next_nvc_step(current_step)
         
         # Check if we need request clarification
@@ -665,52 +900,13 @@ async def nvc_conversation(request: ConversationRequest):
         
         # Enhanced step responses with refining questions
         if needs_request_clarification:
-            # Ask clarifying questions about the request
-            clarification_questions = [
-                "What would make this request realistic and workable for both of you?",
-                "When would be the best time to make this request?", 
-                "How could you phrase this request in a way that opens dialogue?",
-                "What might help the other person feel willing to consider your request?"
-            ]
-            import random
-            selected_question = random.choice(clarification_questions)
-            
-            step_responses = {
-                "request": {
-                    "ai_response": f"Let me help you refine that request. {selected_question} Also, is there anything else about this situation you'd like to explore before we create your complete NVC framework?",
-                    "guidance": "Refining your request - making it specific and considerate.",
-                    "example": "Consider timing, wording, and what would make it easy for them to say yes"
-                }
-            }
+            # Ask clarifying questions about the request; other steps get the default reply
+            if next_step == "request":
+                response_data = random.choice(REQUEST_CLARIFICATION_RESPONSES)
+            else:
+                response_data = DEFAULT_STEP_RESPONSE
         else:
-            step_responses = {
-                "observation": {
-                    "ai_response": "I hear you describing what you observed. Can you help me understand more details? What exactly did you see or hear that concerns you?",
-                    "guidance": "Great start with observation! Let's get more specific facts.",
-                    "example": "Instead of 'He was being rude' try 'He interrupted me twice and didn't acknowledge my ideas'"
-                },
-                "feeling": {
-                    "ai_response": "Thank you for sharing your feelings. Can you tell me more about what emotions come up when you think about this situation? What's the strongest feeling you notice?",
-                    "guidance": "You're expressing feelings - let's explore them deeper.",
-                    "example": "Try specific feelings: frustrated, disappointed, hurt, worried, hopeful"
-                },
-                "need": {
-                    "ai_response": "I understand your needs better now. What would it look like if this need was met? How would you feel different?",
-                    "guidance": "You're identifying your needs - let's explore what meeting them would mean.",
-                    "example": "Universal needs: understanding, respect, connection, autonomy, recognition, collaboration"
-                },
-                "request": {
-                    "ai_response": "That sounds like a clear request. How realistic do you think this request is? What might make the other person willing to consider it?",
-                    "guidance": "You're making a request - let's make it as effective as possible.",
-                    "example": "Make requests specific, positive, and considerate: 'Would you be willing to...' works better than 'Don't...'"
-                }
-            }
-        
-        response_data = step_responses.get(next_step, {
-            "ai_response": "Let's work through this together step by step.",
-            "guidance": "NVC helps us connect with needs and find solutions.",
-            "example": "Start with what you observed without judgment."
-        })
+            response_data = STEP_RESPONSES.get(next_step, DEFAULT_STEP_RESPONSE)
         
         vocabulary = get_nvc_vocabulary_for_step(next_step)
         suggestions = get_generic_suggestions(next_step)
@@ -725,7 +921,7 @@ async def nvc_conversation(request: ConversationRequest):
         )
         
     except Exception as e:
-        logger.error(f"NVC conversation error: {e}")
+        logger.error("NVC conversation error: {}", e)
         # Basic fallback
         return ConversationResponse(
             response="I understand you'd like to work through this situation using NVC. Let's start with what you observed.",
@@ -736,48 +932,123 @@ async def nvc_conversation(request: ConversationRequest):
             vocabulary_options=["noticed", "observed", "heard", "saw"]
         )
 
-@router.get("/feelings")
-async def get_feelings_list():
-    """Get list of NVC feelings vocabulary."""
-    feelings = {
-        "when_needs_met": [
-            "grateful", "happy", "excited", "peaceful", "confident", "hopeful",
-            "joyful", "content", "fulfilled", "energized", "inspired", "relieved"
-        ],
-        "when_needs_not_met": [
-            "angry", "frustrated", "sad", "worried", "confused", "disappointed",
-            "hurt", "scared", "lonely", "overwhelmed", "irritated", "anxious"
-        ]
-    }
-    return feelings
-
-@router.get("/needs")
-async def get_needs_list():
-    """Get list of universal human needs."""
-    needs = {
-        "connection": ["love", "friendship", "intimacy", "community", "belonging"],
-        "physical": ["safety", "shelter", "food", "rest", "health", "exercise"],
-        "autonomy": ["choice", "freedom", "independence", "self-expression", "creativity"],
-        "meaning": ["purpose", "growth", "learning", "contribution", "understanding"],
-        "celebration": ["joy", "beauty", "fun", "play", "humor", "hope"]
-    }
-    return needs
-
-@router.get("/examples")
-async def get_nvc_examples():
-    """Get NVC practice examples."""
-    examples = {
-        "full_example": {
-            "observation": "When I see you checking your phone during our conversation",
-            "feeling": "I feel disconnected and frustrated",
-            "need": "because I need presence and connection when we talk",
-            "request": "Would you be willing to put your phone away while we're talking?"
-        },
-        "tips": [
-            "Start with 'When I see/hear...' for observations",
-            "Use 'I feel...' followed by actual emotions, not thoughts",
-            "Connect feelings to universal human needs",
-            "Make requests specific, positive, and doable"
-        ]
-    }
-    return examples
\ No newline at end of file
+@router.post("/conversation/stream", response_model=None)
+async def nvc_conversation_stream(request: ConversationRequest):
+    """
+    Streaming variant of /conversation using server-sent events.
+
+    The facilitator reply is sent as `data: {"delta": ...}` events while the
+    model generates it, followed by one `event: complete` whose data is the
+    full ConversationResponse. Turns that need no model output (summaries,
+    rule-based fallback) are sent as the complete event alone.
+    """
+    if not is_authenticated(request):
+        raise HTTPException(status_code=401, detail="Authentication required. Please provide valid credentials.")
+    
+    client = get_openai_client()
+    conversation_history = [*(request.conversation_history or []), request.message]
+    keywords = scan_turn(conversation_history)
+    
+    if not client or should_complete_conversation(conversation_history, keywords):
+        result = await nvc_conversation(request)
+        return StreamingResponse(
+            iter([sse_event(result.model_dump(), event="complete")]),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+    
+    messages = get_facilitator_messages(get_nvc_prompt(request.message, request.context, conversation_history, keywords))
+    key = completion_cache_key(messages, FACILITATOR_PARAMS)
+    
+    async def events():
+        # Step detection runs while the reply streams. It starts with the body,
+        # not before, so a client gone before the first byte leaves no task
+        # behind; the finally below cancels it on any later exit.
+        step_task = asyncio.create_task(detect_nvc_step_with_ai(request.message, conversation_history, keywords.message))
+        try:
+            ai_response = _completion_cache.get(key)
+            if ai_response is not None:
+                yield sse_event({"delta": ai_response})
+            else:
+                parts = []
+                stream = await create_chat_completion(client, messages=messages, stream=True, **FACILITATOR_PARAMS)
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        parts.append(delta)
+                        yield sse_event({"delta": delta})
+                ai_response = "".join(parts).strip()
+                _completion_cache.set(key, ai_response)
+            
+            next_step = get_next_nvc_step(await step_task)
+            yield sse_event(build_ai_turn_response(ai_response, next_step).model_dump(), event="complete")
+        except Exception as e:
+            logger.error("NVC conversation stream error: {}", e)
+            yield sse_event({"detail": "The facilitator reply could not be completed."}, event="error")
+        finally:
+            step_task.cancel()
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+# Static NVC reference data, rendered once and served without per-request work
+FEELINGS = {
+    "when_needs_met": [
+        "grateful", "happy", "excited", "peaceful", "confident", "hopeful",
+        "joyful", "content", "fulfilled", "energized", "inspired", "relieved"
+    ],
+    "when_needs_not_met": [
+        "angry", "frustrated", "sad", "worried", "confused", "disappointed",
+        "hurt", "scared", "lonely", "overwhelmed", "irritated", "anxious"
+    ]
+}
+
+NEEDS = {
+    "connection": ["love", "friendship", "intimacy", "community", "belonging"],
+    "physical": ["safety", "shelter", "food", "rest", "health", "exercise"],
+    "autonomy": ["choice", "freedom", "independence", "self-expression", "creativity"],
+    "meaning": ["purpose", "growth", "learning", "contribution", "understanding"],
+    "celebration": ["joy", "beauty", "fun", "play", "humor", "hope"]
+}
+
+EXAMPLES = {
+    "full_example": {
+        "observation": "When I see you checking your phone during our conversation",
+        "feeling": "I feel disconnected and frustrated",
+        "need": "because I need presence and connection when we talk",
+        "request": "Would you be willing to put your phone away while we're talking?"
+    },
+    "tips": [
+        "Start with 'When I see/hear...' for observations",
+        "Use 'I feel...' followed by actual emotions, not thoughts",
+        "Connect feelings to universal human needs",
+        "Make requests specific, positive, and doable"
+    ]
+}
+
+# Catalogs only change with a deploy, so browsers and CDNs may keep them for a long time
+CATALOG_RESPONSE_OPTIONS = {
+    "cache_control": f"public, max-age={settings.CATALOG_CACHE_MAX_AGE}",
+    "gzip_minimum_size": settings.GZIP_MINIMUM_SIZE,
+}
+
+FEELINGS_ENDPOINT = StaticEndpoint.json(FEELINGS, **CATALOG_RESPONSE_OPTIONS)
+NEEDS_ENDPOINT = StaticEndpoint.json(NEEDS, **CATALOG_RESPONSE_OPTIONS)
+EXAMPLES_ENDPOINT = StaticEndpoint.json(EXAMPLES, **CATALOG_RESPONSE_OPTIONS)
+
+@router.get("/feelings", response_model=None)
+@router.head("/feelings", include_in_schema=False)
+async def get_feelings_list(request: Request) -> Response:
+    """Get list of NVC feelings vocabulary"""
+    return FEELINGS_ENDPOINT.respond(request)
+
+@router.get("/needs", response_model=None)
+@router.head("/needs", include_in_schema=False)
+async def get_needs_list(request: Request) -> Response:
+    """Get list of universal human needs"""
+    return NEEDS_ENDPOINT.respond(request)
+
+@router.get("/examples", response_model=None)
+@router.head("/examples", include_in_schema=False)
+async def get_nvc_examples(request: Request) -> Response:
+    """Get NVC practice examples"""
+    return EXAMPLES_ENDPOINT.respond(request)
@@ -6,17 +6,21 @@ from fastapi import APIRouter
 router = APIRouter()
 
 # TODO: Implement research endpoints
-@router.post("/consent")
+_RESEARCH_CONSENT_RESPONSE = {"message": "Research consent endpoint - TODO"}
+_GET_RESEARCH_COHORTS_RESPONSE = {"message": "Get research cohorts endpoint - TODO"}
+_RESEARCH_ENROLLMENT_RESPONSE = {"message": "Research enrollment endpoint - TODO"}
+
+@router.post("/consent", response_model=None, include_in_schema=False)
 async def update_research_consent():
     """Update user's research consent preferences."""
-    return {"message": "Research consent endpoint - TODO"}
+    return _RESEARCH_CONSENT_RESPONSE
 
-@router.get("/cohorts")
+@router.get("/cohorts", response_model=None, include_in_schema=False)
 async def get_available_research_cohorts():
     """Get available research cohorts for enrollment."""
-    return {"message": "Get research cohorts endpoint - TODO"}
+    return _GET_RESEARCH_COHORTS_RESPONSE
 
-@router.post("/enroll")
+@router.post("/enroll", response_model=None, include_in_schema=False)
 async def enroll_in_research():
     """Enroll user in a research cohort."""
-    return {"message": "Research enrollment endpoint - TODO"}
\ No newline at end of file
+    return _RESEARCH_ENROLLMENT_RESPONSE
\ No newline at end of file
@@ -6,12 +6,15 @@ from fastapi import APIRouter
 router = APIRouter()
 
 # TODO: Implement user management endpoints
-@router.get("/me")
+_GET_CURRENT_USER_RESPONSE = {"message": "Get current user endpoint - TODO"}
+_UPDATE_USER_RESPONSE = {"message": "Update user endpoint - TODO"}
+
+@router.get("/me", response_model=None, include_in_schema=False)
 async def get_current_user():
     """Get current user profile."""
-    return {"message": "Get current user endpoint - TODO"}
+    return _GET_CURRENT_USER_RESPONSE
 
-@router.put("/me")
+@router.put("/me", response_model=None, include_in_schema=False)
 async def update_current_user():
     """Update current user profile."""
-    return {"message": "Update user endpoint - TODO"}
\ No newline at end of file
+    return _UPDATE_USER_RESPONSE
\ No newline at end of file
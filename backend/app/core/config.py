@@ -2,14 +2,18 @@
 Application configuration settings using Pydantic Settings
 Handles environment variables and configuration management
 """
+from functools import lru_cache
 from typing import List, Optional
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
+    # Read once at startup and shared process-wide, so never mutated afterwards
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+    
     # Application Settings
     APP_NAME: str = "NVC AI Facilitator"
     APP_VERSION: str = "2.0.0-ai-step-detection"
@@ -18,6 +22,8 @@ class Settings(BaseSettings):
     
     # Database Configuration  
     DATABASE_URL: str = Field(default="sqlite:///./nvc_test.db", description="Database connection string")
+    DATABASE_POOL_SIZE: int = 20  # Connections kept open per worker
+    DATABASE_MAX_OVERFLOW: int = 10  # Extra connections allowed under burst load
     
     # AI Model API Keys
     OPENAI_API_KEY: Optional[str] = None
@@ -42,6 +48,13 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     
+    # HTTP Caching
+    CATALOG_CACHE_MAX_AGE: int = 86400  # Seconds clients/CDNs may reuse static NVC catalogs
+    GZIP_MINIMUM_SIZE: int = 500  # Bytes; smaller bodies are sent uncompressed
+    
+    # Server Processes
+    WEB_CONCURRENCY: int = 1  # Uvicorn workers; set in the environment, where the launcher reads it
+    
     # WebSocket Configuration
     WS_HEARTBEAT_INTERVAL: int = 30
     
@@ -49,25 +62,25 @@ class Settings(BaseSettings):
     DEFAULT_AI_MODEL: str = "openai"
     MAX_CONVERSATION_MEMORY: int = 10
     AI_RESPONSE_TIMEOUT: int = 30
+    AI_MAX_RETRIES: int = 1  # Retries per OpenAI call on connection errors, 429s and 5xx
+    OPENAI_REQUESTS_PER_MINUTE: int = 450  # Whole-deployment cap, split evenly across workers; keep below the tier's RPM; 0 disables
+    PROMPT_HISTORY_MAX_CHARS: int = 2000  # Budget for recent history quoted in prompts (~500 tokens)
+    AI_RESPONSE_CACHE_SIZE: int = 1024  # Completions kept per worker for identical prompts; 0 disables
     
-    @validator("CORS_ORIGINS", pre=True)
-    def assemble_cors_origins(cls, v):
-        """Parse CORS origins from string or list."""
-        if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
-    
-    @validator("ALLOWED_HOSTS", pre=True)
-    def assemble_allowed_hosts(cls, v):
-        """Parse allowed hosts from string or list."""
+    @field_validator("CORS_ORIGINS", "ALLOWED_HOSTS", mode="before")
+    @classmethod
+    def split_comma_separated(cls, v):
+        """Parse CORS origins and allowed hosts from string or list."""
         if isinstance(v, str):
             return [i.strip() for i in v.split(",")]
         return v
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment and .env once."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Client-side rate limiting for outbound API calls
+"""
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per ``period`` seconds.
+
+    Bursts up to ``capacity`` pass immediately; beyond that, callers wait in
+    arrival order for the bucket to refill instead of being rejected upstream.
+    A non-positive rate disables limiting.
+
+    Each caller reserves its token on arrival, letting the balance go negative,
+    and then sleeps until the refill covers it. No lock is held while waiting,
+    and a caller cancelled mid-wait forfeits its token.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0, capacity: Optional[float] = None):
+        self.enabled = rate > 0
+        self.fill_rate = rate / period if self.enabled else 0.0
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        if not self.enabled:
+            return
+        # No await before the reservation, so concurrent callers cannot interleave here
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.fill_rate)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
@@ -0,0 +1,146 @@
+"""
+JSON response classes and precomputed responses for constant payloads
+"""
+import gzip
+import hashlib
+from typing import Any, List, Optional, Tuple
+
+import orjson
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson's C encoder instead of stdlib json."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def sse_event(data: Any, event: Optional[str] = None) -> bytes:
+    """Encode one server-sent event with a JSON data field."""
+    payload = b"data: " + orjson.dumps(data) + b"\n\n"
+    if event:
+        return b"event: " + event.encode("utf-8") + b"\n" + payload
+    return payload
+
+
+class StaticEndpoint:
+    """Pure ASGI endpoint that replays a response body rendered once at import.
+
+    Constant payloads do not need FastAPI's request parsing, validation or
+    per-request JSON encoding, so the body and headers are built up front and
+    written back with a single start/body send pair. A strong ETag is derived
+    from the body so conditional GETs are answered with an empty 304.
+
+    Bodies of at least ``gzip_minimum_size`` bytes are also compressed once up
+    front; clients that accept gzip get that variant with its own ETag.
+
+    Mount it directly as an ASGI app, or return ``respond(request)`` from a
+    FastAPI route so the endpoint stays in the OpenAPI schema.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str = "application/json",
+        status_code: int = 200,
+        cache_control: Optional[str] = None,
+        gzip_minimum_size: Optional[int] = None,
+    ):
+        self.status_code = status_code
+        compressible = gzip_minimum_size is not None and len(body) >= gzip_minimum_size
+
+        common: List[Tuple[bytes, bytes]] = []
+        if cache_control:
+            common.append((b"cache-control", cache_control.encode("latin-1")))
+        if compressible:
+            common.append((b"vary", b"Accept-Encoding"))
+
+        self.identity = _Variant(body, media_type, common)
+        self.gzip: Optional[_Variant] = None
+        if compressible:
+            self.gzip = _Variant(
+                gzip.compress(body, compresslevel=9, mtime=0), media_type, common, encoding=b"gzip"
+            )
+
+    @classmethod
+    def json(cls, content: Any, **kwargs: Any) -> "StaticEndpoint":
+        """Render content as JSON once and serve the resulting bytes."""
+        return cls(orjson.dumps(content), **kwargs)
+
+    def select_variant(self, scope) -> "_Variant":
+        """Pick the gzip body when the client lists gzip in Accept-Encoding."""
+        if self.gzip is not None:
+            for name, value in scope["headers"]:
+                if name == b"accept-encoding":
+                    for coding in value.lower().split(b","):
+                        coding, _, params = coding.partition(b";")
+                        if coding.strip() == b"gzip" and params.replace(b" ", b"") not in (b"q=0", b"q=0.0"):
+                            return self.gzip
+        return self.identity
+
+    def resolve(self, scope) -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+        """Status, headers and body to send for this request."""
+        variant = self.select_variant(scope)
+        if variant.is_not_modified(scope):
+            return 304, variant.not_modified_headers, b""
+        # HEAD keeps GET's headers, Content-Length included, but sends no body
+        body = b"" if scope["method"] == "HEAD" else variant.body
+        return self.status_code, variant.headers, body
+
+    def respond(self, request: Request) -> Response:
+        """The prebuilt response for request, as a Response a route can return."""
+        return _ReplayResponse(*self.resolve(request.scope))
+
+    async def __call__(self, scope, receive, send) -> None:
+        status, headers, body = self.resolve(scope)
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+class _ReplayResponse(Response):
+    """Response around a StaticEndpoint's prebuilt status, headers and body."""
+
+    def __init__(self, status_code: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        self.status_code = status_code
+        self.raw_headers = list(headers)  # Copied: FastAPI may append sub-response headers
+        self.body = body
+        self.background = None
+
+
+class _Variant:
+    """One encoding of a StaticEndpoint body with its prebuilt headers."""
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str,
+        common: List[Tuple[bytes, bytes]],
+        encoding: Optional[bytes] = None,
+    ):
+        self.body = body
+        tag = hashlib.sha256(body).hexdigest()[:16].encode("latin-1")
+        self.etag = b'"' + tag + (b"-" + encoding if encoding else b"") + b'"'
+
+        validators: List[Tuple[bytes, bytes]] = [(b"etag", self.etag), *common]
+        self.headers: List[Tuple[bytes, bytes]] = [
+            (b"content-type", media_type.encode("latin-1")),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        if encoding:
+            self.headers.append((b"content-encoding", encoding))
+        self.headers.extend(validators)
+        self.not_modified_headers = validators
+
+    def is_not_modified(self, scope) -> bool:
+        """Check whether the request's If-None-Match already names this body."""
+        if scope["method"] not in ("GET", "HEAD"):
+            return False
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                for candidate in value.split(b","):
+                    candidate = candidate.strip()
+                    if candidate == b"*" or candidate.removeprefix(b"W/") == self.etag:
+                        return True
+        return False
@@ -0,0 +1,33 @@
+"""
+Request timing middleware
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class TimingMiddleware:
+    """Report each request's server-side handling time in an X-Process-Time header.
+
+    Written as plain ASGI rather than BaseHTTPMiddleware, so a request does not
+    pay for an extra task and memory stream. The value, in seconds, is measured
+    up to the response start message, which is when the header must be sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = f"{time.perf_counter() - start:.6f}".encode("latin-1")
+                message["headers"] = [*message.get("headers", ()), (b"x-process-time", elapsed)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
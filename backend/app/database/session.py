@@ -1,31 +1,59 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.DEBUG
+# Async drivers for the URL schemes DATABASE_URL is configured with
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """Rewrite a plain database URL to use its asyncio driver."""
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+# SQLite connections never go stale server-side, so they skip the pre-ping
+# round trip and share one persistent connection; network databases get a
+# sized, health-checked pool
+if settings.DATABASE_URL.startswith("sqlite"):
+    engine_options = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
+else:
+    engine_options = {
+        "pool_pre_ping": True,
+        "pool_recycle": 300,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+    }
+
+# Create SQLAlchemy engine; queries await the driver instead of blocking the event loop
+engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    **engine_options
 )
 
 # Create sessionmaker
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # Create declarative base for models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session."""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -4,31 +4,40 @@ Provides AI-powered Non-Violent Communication facilitation
 """
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional, Tuple
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 from loguru import logger
 import os
 
 from app.core.config import settings
-from app.api import api_router
+from app.core.logging import setup_logging
+from app.core.responses import ORJSONResponse, StaticEndpoint
+from app.core.timing import TimingMiddleware
+from app.api import api_router, mount_flat
+from app.api.nvc import close_openai_client
+
+
+# Apply LOG_LEVEL before anything logs; until then loguru emits every debug record
+setup_logging()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup and shutdown events."""
     # Startup
-    logger.info(f"Starting NVC AI Facilitator v{settings.APP_VERSION}")
-    logger.info(f"Environment: {os.getenv('RAILWAY_ENVIRONMENT', 'local')}")
+    logger.info("Starting NVC AI Facilitator v{}", settings.APP_VERSION)
+    logger.info("Environment: {}", os.getenv("RAILWAY_ENVIRONMENT", "local"))
     
     yield
     
     # Shutdown
-    logger.info(f"Shutting down NVC AI Facilitator v{settings.APP_VERSION}")
+    logger.info("Shutting down NVC AI Facilitator v{}", settings.APP_VERSION)
+    await close_openai_client()
 
 
 # Create FastAPI application instance
@@ -39,6 +48,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -49,51 +59,94 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers reuse a preflight for a day instead of one per POST
+)
+
+# Compress dynamic JSON and the test UI; bodies that already carry a
+# Content-Encoding (precompressed catalogs) and, from Starlette 0.46, SSE
+# streams pass through untouched
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=6,
 )
 
+# Added last so it is outermost and times the whole middleware stack
+app.add_middleware(TimingMiddleware)
 
-# Include API routes
-app.include_router(api_router, prefix=settings.API_V1_STR)
 
-# Serve the test UI
-@app.get("/test")
-async def serve_test_ui():
+# Include API routes
+mount_flat(app.router, api_router, prefix=settings.API_V1_STR)
+
+# Test UI: the project root copy first, then paths used by other deployments
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+TEST_UI_PATHS = [
+    os.path.join(PROJECT_ROOT, "test_ui.html"),
+    "test_ui.html",
+    "../test_ui.html",
+    "../../test_ui.html",
+    "/app/test_ui.html"
+]
+
+_test_ui_path: Optional[str] = None
+_test_ui_cache: Tuple[int, Optional[StaticEndpoint]] = (0, None)  # (mtime_ns, endpoint)
+
+
+def load_test_ui() -> Optional[StaticEndpoint]:
+    """Endpoint replaying the test UI, or None if it cannot be found.
+
+    The file is located once and re-read only when its modification time
+    changes, so a request costs a single stat instead of a search and a read.
+    Each read rebuilds the endpoint, giving the page a fresh ETag and a gzip
+    variant compressed once; no-cache makes browsers revalidate with the ETag,
+    so an unchanged page costs an empty 304.
+    """
+    global _test_ui_path, _test_ui_cache
+    if _test_ui_path is None:
+        _test_ui_path = next((path for path in TEST_UI_PATHS if os.path.exists(path)), None)
+        if _test_ui_path is None:
+            return None
+        logger.info("Serving test UI from: {}", _test_ui_path)
+    try:
+        mtime = os.stat(_test_ui_path).st_mtime_ns
+        if mtime != _test_ui_cache[0]:
+            with open(_test_ui_path, "rb") as f:
+                endpoint = StaticEndpoint(
+                    f.read(),
+                    media_type="text/html; charset=utf-8",
+                    cache_control="no-cache",
+                    gzip_minimum_size=settings.GZIP_MINIMUM_SIZE,
+                )
+            _test_ui_cache = (mtime, endpoint)
+    except OSError:
+        _test_ui_path = None
+        return None
+    return _test_ui_cache[1]
+
+
+# Serve the test UI. Routes serving a StaticEndpoint also answer HEAD, kept out
+# of the schema so each path documents a single GET operation
+@app.get("/test", response_model=None)
+@app.head("/test", include_in_schema=False)
+async def serve_test_ui(request: Request) -> Response:
     """Serve the test UI HTML file."""
-    # Look for test_ui.html in the project root directory
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    test_ui_path = os.path.join(project_root, "test_ui.html")
-    
-    logger.info(f"Looking for test UI at: {test_ui_path}")
+    test_ui = load_test_ui()
+    if test_ui is not None:
+        return test_ui.respond(request)
     
-    if os.path.exists(test_ui_path):
-        return FileResponse(test_ui_path, media_type="text/html")
-    else:
-        # Fallback paths
-        fallback_paths = [
-            "test_ui.html",
-            "../test_ui.html", 
-            "../../test_ui.html",
-            "/app/test_ui.html"
-        ]
-        
-        for fallback_path in fallback_paths:
-            if os.path.exists(fallback_path):
-                logger.info(f"Found test UI at fallback path: {fallback_path}")
-                return FileResponse(fallback_path, media_type="text/html")
-        
-        return JSONResponse({
-            "error": "Test UI file not found", 
-            "searched_paths": [test_ui_path] + fallback_paths,
-            "current_dir": os.getcwd(),
-            "files_in_current_dir": os.listdir(".")
-        }, status_code=404)
+    return ORJSONResponse({
+        "error": "Test UI file not found", 
+        "searched_paths": TEST_UI_PATHS,
+        "current_dir": os.getcwd(),
+        "files_in_current_dir": os.listdir(".")
+    }, status_code=404)
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Global exception handler for unhandled errors."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.opt(exception=exc).error("Unhandled exception: {}", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -102,52 +155,42 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     )
 
 
-@app.get("/health")
-async def health_check() -> dict:
+# Health check for load balancers and monitoring; polled constantly, so the body
+# is rendered once and no-store keeps intermediaries from answering for us.
+HEALTH = StaticEndpoint.json(
+    {"status": "healthy", "app_name": settings.APP_NAME, "version": settings.APP_VERSION},
+    cache_control="no-store",
+)
+
+
+@app.get("/health", response_model=None)
+@app.head("/health", include_in_schema=False)
+async def health_check(request: Request) -> Response:
     """Health check endpoint for load balancers and monitoring."""
-    return {
-        "status": "healthy",
-        "app_name": settings.APP_NAME,
-        "version": settings.APP_VERSION
-    }
+    return HEALTH.respond(request)
+
 
+# If no UI file is found, / falls back to basic info, rendered once
+ROOT_INFO = StaticEndpoint.json({
+    "message": "NVC AI Facilitator API",
+    "version": settings.APP_VERSION,
+    "docs_url": f"{settings.API_V1_STR}/docs",
+    "error": "UI file not found - showing API info instead"
+})
 
-@app.get("/")
-async def root():
+
+@app.get("/", response_model=None)
+@app.head("/", include_in_schema=False)
+async def root(request: Request) -> Response:
     """Root endpoint - serve the full NVC UI directly."""
     # Serve the same UI as /test endpoint at the root
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    test_ui_path = os.path.join(project_root, "test_ui.html")
-    
-    logger.info(f"Root endpoint looking for UI at: {test_ui_path}")
-    
-    if os.path.exists(test_ui_path):
-        return FileResponse(test_ui_path, media_type="text/html")
-    else:
-        # Fallback paths
-        fallback_paths = [
-            "test_ui.html",
-            "../test_ui.html", 
-            "../../test_ui.html",
-            "/app/test_ui.html"
-        ]
-        
-        for fallback_path in fallback_paths:
-            if os.path.exists(fallback_path):
-                logger.info(f"Root endpoint found UI at fallback path: {fallback_path}")
-                return FileResponse(fallback_path, media_type="text/html")
-        
-        # If no UI file found, return basic info
-        return JSONResponse({
-            "message": "NVC AI Facilitator API",
-            "version": settings.APP_VERSION,
-            "docs_url": f"{settings.API_V1_STR}/docs",
-            "error": "UI file not found - showing API info instead"
-        })
+    test_ui = load_test_ui()
+    if test_ui is not None:
+        return test_ui.respond(request)
+    return ROOT_INFO.respond(request)
 
 
 if __name__ == "__main__":
-    import os
     port = int(os.getenv("PORT", 19000))
     uvicorn.run(
         "app.main:app",
@@ -0,0 +1,33 @@
+"""
+Single-pass keyword matching for the NVC heuristics
+"""
+import re
+from typing import FrozenSet, Iterable
+
+
+class KeywordScanner:
+    """Report which of a fixed set of keywords occur anywhere in a text.
+
+    All keywords are compiled into one regex, so a message is scanned once
+    instead of once per keyword. Matching is plain substring containment,
+    the same as ``keyword in text``: the alternation is ordered longest
+    first inside a lookahead, so every position yields its longest keyword,
+    and the keywords contained in that one are added from a precomputed map.
+    Texts must already be lowercased, like the keywords.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        ordered = sorted(set(keywords), key=lambda keyword: (-len(keyword), keyword))
+        self.max_length = len(ordered[0]) if ordered else 0
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+        self._contained = {
+            keyword: frozenset(other for other in ordered if other in keyword)
+            for keyword in ordered
+        }
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Return every keyword that is a substring of ``text``."""
+        hits = set()
+        for keyword in set(self._pattern.findall(text)):
+            hits |= self._contained[keyword]
+        return frozenset(hits)
@@ -0,0 +1,110 @@
+"""
+Tests for the cached, coalesced OpenAI completions
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import nvc
+from app.core.cache import LRUCache
+
+MESSAGES = [{"role": "user", "content": "I feel frustrated at work."}]
+
+
+class FakeClient:
+    """AsyncOpenAI stand-in whose completions wait for release() and count calls."""
+
+    def __init__(self, failures: int = 0):
+        self.calls = 0
+        self.failures = failures
+        self.released = asyncio.Event()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def release(self) -> None:
+        self.released.set()
+
+    async def create(self, **params):
+        self.calls += 1
+        await self.released.wait()
+        if self.calls <= self.failures:
+            raise RuntimeError("upstream error")
+        message = SimpleNamespace(content=f"  reply {self.calls}  ")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(nvc, "_completion_cache", LRUCache(16))
+    monkeypatch.setattr(nvc, "_completion_inflight", {})
+
+
+async def settle() -> None:
+    """Let every started task run up to its first blocking await."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_identical_prompts_share_one_upstream_call():
+    async def scenario():
+        client = FakeClient()
+        variants = [MESSAGES, [{"role": "user", "content": "i feel  frustrated at work"}], MESSAGES]
+        callers = [
+            asyncio.create_task(nvc.cached_chat_completion(client, messages, temperature=0.7))
+            for messages in variants
+        ]
+        await settle()
+        client.release()
+        return client, await asyncio.gather(*callers)
+
+    client, texts = asyncio.run(scenario())
+
+    assert client.calls == 1
+    assert texts == ["reply 1"] * 3
+    assert nvc._completion_inflight == {}
+
+
+def test_completed_prompt_is_served_from_cache():
+    async def scenario():
+        client = FakeClient()
+        client.release()
+        first = await nvc.cached_chat_completion(client, MESSAGES, temperature=0.7)
+        second = await nvc.cached_chat_completion(client, MESSAGES, temperature=0.7)
+        return client, first, second
+
+    client, first, second = asyncio.run(scenario())
+
+    assert client.calls == 1
+    assert first == second == "reply 1"
+
+
+def test_different_params_are_not_coalesced():
+    async def scenario():
+        client = FakeClient()
+        client.release()
+        await nvc.cached_chat_completion(client, MESSAGES, temperature=0.7)
+        await nvc.cached_chat_completion(client, MESSAGES, temperature=0.2)
+        return client
+
+    assert asyncio.run(scenario()).calls == 2
+
+
+def test_failed_call_is_not_cached():
+    async def scenario():
+        client = FakeClient(failures=1)
+        callers = [
+            asyncio.create_task(nvc.cached_chat_completion(client, MESSAGES, temperature=0.7))
+            for _ in range(2)
+        ]
+        await settle()
+        client.release()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        retry = await nvc.cached_chat_completion(client, MESSAGES, temperature=0.7)
+        return client, results, retry
+
+    client, results, retry = asyncio.run(scenario())
+
+    # Both waiters see the one failure; the next request goes upstream again
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert retry == "reply 2"
+    assert client.calls == 2
@@ -0,0 +1,17 @@
+"""
+Tests for the conversation management endpoints
+"""
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+MESSAGES_URL = "/api/v1/conversations/abc123/messages"
+
+
+def test_send_message_returns_one_result():
+    response = client.post(MESSAGES_URL, json={"content": "Hello"})
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "Send message endpoint - TODO"}
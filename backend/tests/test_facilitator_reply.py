@@ -0,0 +1,46 @@
+"""
+Tests for parsing the structured facilitator reply
+"""
+import orjson
+import pytest
+
+from app.api.nvc import FacilitatorReply, parse_facilitator_reply
+
+
+def reply_json(**overrides) -> str:
+    turn = {
+        "response": " What did you notice? ",
+        "suggested_responses": ["I noticed the door slam", " ", "I heard raised voices", "I saw", "extra"],
+        "detected_step": "observation",
+    }
+    turn.update(overrides)
+    return orjson.dumps(turn).decode()
+
+
+@pytest.mark.parametrize("text", [reply_json(), f"```json\n{reply_json()}\n```", f"```{reply_json()}```"])
+def test_valid_reply_is_split_into_fields(text):
+    assert parse_facilitator_reply(text) == FacilitatorReply(
+        "What did you notice?",
+        ["I noticed the door slam", "I heard raised voices", "I saw"],
+        "observation",
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "What did you notice about the situation?",
+        '{"response": "What did you notice?", "suggested_responses": [',
+        "[]",
+        reply_json(detected_step="judgment"),
+        reply_json(detected_step="Feeling"),
+        reply_json(detected_step=None),
+        reply_json(suggested_responses="I noticed the door slam"),
+        reply_json(response="   "),
+        reply_json(mood="calm"),
+        '{"response": "What did you notice?"}',
+    ],
+)
+def test_malformed_or_out_of_schema_reply_falls_back_to_raw_text(text):
+    assert parse_facilitator_reply(text) == FacilitatorReply(text, [], None)
@@ -0,0 +1,33 @@
+"""
+Tests for the NVC keyword scanning helpers
+"""
+import pytest
+
+from app.api.nvc import KEYWORD_SCANNER, scan_history
+
+
+@pytest.mark.parametrize(
+    "history, keyword",
+    [
+        (["would", "you be", "willing"], "would you be willing"),
+        (["i", "am", "done"], "i am done"),
+        (["could", "you", "please"], "could you please"),
+        (["can", "we", "finish"], "can we finish"),
+    ],
+)
+def test_scan_history_finds_keywords_spanning_several_messages(history, keyword):
+    assert keyword in scan_history(history)
+
+
+@pytest.mark.parametrize(
+    "history",
+    [
+        [],
+        ["I feel frustrated"],
+        ["I noticed", "you were late", "and I FEEL worried"],
+        ["would", "", "you be", "willing to", "help?"],
+        ["Show me", "the summary", "please"],
+    ],
+)
+def test_scan_history_matches_scanning_the_joined_text(history):
+    assert scan_history(history) == KEYWORD_SCANNER.scan(" ".join(history).lower())
@@ -0,0 +1,90 @@
+"""
+Tests for the client-side token bucket
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import AsyncTokenBucket
+
+
+class FakeClock:
+    """Stands in for the module's time and asyncio: time moves only when told."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(rate_limit, "asyncio", SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def acquire_times(bucket: AsyncTokenBucket, count: int) -> None:
+    for _ in range(count):
+        async with bucket:
+            pass
+
+
+def test_burst_up_to_capacity_does_not_wait(clock):
+    run(acquire_times(AsyncTokenBucket(5, period=5.0), 5))
+
+    assert clock.sleeps == []
+
+
+def test_callers_past_the_burst_wait_in_arrival_order(clock):
+    run(acquire_times(AsyncTokenBucket(2, period=2.0), 5))  # 1 token per second
+
+    assert clock.sleeps == pytest.approx([1.0, 2.0, 3.0])
+
+
+def test_concurrent_callers_reserve_successive_slots(clock):
+    bucket = AsyncTokenBucket(60, capacity=2)  # 1 token per second
+
+    async def burst():
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+    run(burst())
+
+    assert sorted(clock.sleeps) == pytest.approx([1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize(
+    "elapsed, expected_sleeps",
+    [
+        (0.5, [0.5, 1.5]),  # half a token refilled
+        (1.5, [0.5]),  # one whole token and half the next
+        (100.0, []),  # refill stops at capacity
+    ],
+)
+def test_refill_follows_elapsed_time(clock, elapsed, expected_sleeps):
+    bucket = AsyncTokenBucket(2, period=2.0)
+    run(acquire_times(bucket, 2))
+
+    clock.now += elapsed
+    run(acquire_times(bucket, 2))
+
+    assert clock.sleeps == pytest.approx(expected_sleeps)
+
+
+def test_non_positive_rate_disables_limiting(clock):
+    run(acquire_times(AsyncTokenBucket(0), 100))
+
+    assert clock.sleeps == []
@@ -0,0 +1,110 @@
+"""
+Tests for the precomputed StaticEndpoint responses
+"""
+import gzip
+import hashlib
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.core.responses import StaticEndpoint
+
+CONTENT = {"items": ["observation", "feeling", "need", "request"] * 50}
+ENDPOINT = StaticEndpoint.json(CONTENT, cache_control="public, max-age=60", gzip_minimum_size=100)
+BODY = ENDPOINT.identity.body
+ETAG = '"' + hashlib.sha256(BODY).hexdigest()[:16] + '"'
+# Strong validators name the exact bytes sent, so the gzip tag hashes the compressed body
+GZIP_ETAG = '"' + hashlib.sha256(ENDPOINT.gzip.body).hexdigest()[:16] + '-gzip"'
+
+app = FastAPI()
+app.add_route("/asgi", ENDPOINT, methods=["GET"])
+
+
+@app.get("/respond", response_model=None)
+@app.head("/respond", include_in_schema=False)
+async def respond(request: Request) -> Response:
+    return ENDPOINT.respond(request)
+
+
+client = TestClient(app)
+
+# The same endpoint mounted as an ASGI app and returned from a FastAPI route
+paths = pytest.mark.parametrize("path", ["/asgi", "/respond"])
+
+
+@paths
+def test_serves_body_with_strong_etag(path):
+    response = client.get(path, headers={"accept-encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["etag"] == ETAG
+    assert response.headers["content-length"] == str(len(BODY))
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert "content-encoding" not in response.headers
+
+
+@paths
+@pytest.mark.parametrize(
+    "accept_encoding, if_none_match",
+    [
+        ("identity", ETAG),
+        ("identity", f'"other", W/{ETAG}'),
+        ("identity", "*"),
+        ("gzip", GZIP_ETAG),
+    ],
+)
+def test_matching_if_none_match_returns_empty_304(path, accept_encoding, if_none_match):
+    response = client.get(path, headers={"accept-encoding": accept_encoding, "if-none-match": if_none_match})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] in (ETAG, GZIP_ETAG)
+
+
+@paths
+@pytest.mark.parametrize("if_none_match", ['"other"', GZIP_ETAG])
+def test_stale_if_none_match_returns_full_body(path, if_none_match):
+    response = client.get(path, headers={"accept-encoding": "identity", "if-none-match": if_none_match})
+
+    assert response.status_code == 200
+    assert response.content == BODY
+
+
+@paths
+def test_head_sends_get_headers_without_body(path):
+    response = client.head(path, headers={"accept-encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["etag"] == ETAG
+    assert response.headers["content-length"] == str(len(BODY))
+
+
+@paths
+@pytest.mark.parametrize("accept_encoding", ["gzip", "deflate, gzip;q=0.8", "GZIP"])
+def test_gzip_variant_is_served_with_its_own_etag(path, accept_encoding):
+    with client.stream("GET", path, headers={"accept-encoding": accept_encoding}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == GZIP_ETAG
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(raw) == BODY
+
+
+@paths
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip;q=0", "br"])
+def test_identity_variant_when_gzip_not_accepted(path, accept_encoding):
+    response = client.get(path, headers={"accept-encoding": accept_encoding})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == ETAG
+    assert response.content == BODY
+
+
+def test_small_body_is_not_compressed():
+    endpoint = StaticEndpoint.json({"status": "ok"}, gzip_minimum_size=100)
+
+    assert endpoint.gzip is None
@@ -0,0 +1,30 @@
+"""
+Tests for the prompt history budget
+"""
+import pytest
+
+from app.api.nvc import trim_history
+
+
+@pytest.mark.parametrize(
+    "history, expected",
+    [
+        ([], []),
+        (["a", "b", "c", "d"], ["b", "c", "d"]),
+        (["hello", "again", "hello"], ["again", "hello"]),
+        (["x" * 8, "y" * 8, "z" * 8], ["y" * 8, "z" * 8]),
+    ],
+)
+def test_trim_history_keeps_newest_distinct_messages_within_budget(history, expected):
+    assert trim_history(history, max_chars=25) == expected
+
+
+@pytest.mark.parametrize(
+    "history",
+    [
+        ["n" * 40],
+        ["older", "n" * 40],
+    ],
+)
+def test_trim_history_cuts_an_oversized_newest_message_to_the_budget(history):
+    assert trim_history(history, max_chars=25) == ["n" * 25]
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-NVC AI Facilitator - Railway Deployment Entry Point
+NVC AI Facilitator - deployment entry point (Procfile and Dockerfile)
 """
 
 import sys
@@ -29,7 +29,10 @@ def main():
         
         # Get port from environment (Railway sets this)
         port = int(os.getenv("PORT", 8000))
-        logger.info(f"Starting server on port: {port}")
+        # Each worker keeps its own completion cache and its share of
+        # OPENAI_REQUESTS_PER_MINUTE (settings.WEB_CONCURRENCY reads the same variable)
+        workers = int(os.getenv("WEB_CONCURRENCY", 1))
+        logger.info(f"Starting server on port: {port} with {workers} worker(s)")
         
         # Import and run the FastAPI app directly
         import uvicorn
@@ -37,9 +40,13 @@ def main():
             "app.main:app",
             host="0.0.0.0",
             port=port,
+            workers=workers,
             reload=False,
+            loop="auto",  # uvloop where installed (not on Windows), else asyncio
+            http="httptools",  # C HTTP parser from requirements.txt
             log_level="info",
-            access_log=True
+            access_log=True,
+            server_header=False
         )
     except Exception as e:
         logger.error(f"Failed to start application: {e}")